@@ -1,54 +1,97 @@
+import io
+
+import numpy as np
+
+COEFFICIENT_SLOTS = ("b[0]", "b[1]", "b[2]", "a[0]", "a[1]", "a[2]")
+SOA_SLOT_NAMES = ("b0", "b1", "b2", "a0", "a1", "a2")
+
+def _format_coefficients(filters):
+    """Format every SOS row of one filter order with a single np.savetxt call"""
+    designed = [sos for sos in filters if sos is not None]
+    if not designed:
+        return iter(())
+    buf = io.StringIO()
+    np.savetxt(buf, np.vstack(designed), fmt="%.12e", delimiter=" ")
+    return (line.split(" ") for line in buf.getvalue().splitlines())
+
+def _band_initialization_lines(bands, filters):
+    """Build the C++ assignment lines for every band of one filter order"""
+    lines = []
+    formatted_rows = _format_coefficients(filters)
+    for band_idx, sos in enumerate(filters):
+        if sos is None:
+            continue
+        center_freq = bands[band_idx][0]
+        lines.append(f"        // Band {band_idx}: {center_freq} Hz")
+        lines.append(f"        pFilterBank->bands[{band_idx}].num_sections = {sos.shape[0]};")
+
+        for sec_idx in range(sos.shape[0]):
+            section = f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}]"
+            row = next(formatted_rows)
+            lines.extend(f"{section}.{slot} = {value};" for slot, value in zip(COEFFICIENT_SLOTS, row))
+            lines.append(f"{section}.z[0] = 0.0;")
+            lines.append(f"{section}.z[1] = 0.0;")
+        lines.append("")
+    return lines
+
+def _soa_declaration_lines(filters, order):
+    """Build SoA coefficient tables (one per slot, [section][band]) for one filter order.
+
+    Bands are contiguous for each section so a C++ kernel can process 4 or 8
+    bands per SIMD lane group. Missing sections and failed bands are padded
+    with a pass-through biquad (b0 = a0 = 1).
+    """
+    num_sections = max((sos.shape[0] for sos in filters if sos is not None), default=1)
+    soa = np.zeros((len(SOA_SLOT_NAMES), num_sections, len(filters)))
+    soa[0] = 1.0
+    soa[3] = 1.0
+    for band_idx, sos in enumerate(filters):
+        if sos is not None:
+            soa[:, :sos.shape[0], band_idx] = sos.T
+
+    lines = [f"// Order {order} coefficients, SoA layout: order{order}_<slot>[section][band]"]
+    for slot_name, table in zip(SOA_SLOT_NAMES, soa):
+        buf = io.StringIO()
+        np.savetxt(buf, table, fmt="%.12e", delimiter=", ")
+        lines.append(f"static const double order{order}_{slot_name}[{num_sections}][NUM_BANDS] = {{")
+        lines.extend(f"    {{ {row} }}," for row in buf.getvalue().splitlines())
+        lines.append("};")
+    lines.append("")
+    return lines
+
 def generate_cpp_initialization(bands, filters_order_2, filters_order_4):
     """Generate C++ coefficient initialization code"""
 
+    lines = [
+        "// C++ Coefficient Initialization for Third-Octave Filters",
+        "// Coefficients stored for transposed-form-II: y = b0*x + s1; s1 = b1*x - a1*y + s2; s2 = b2*x - a2*y;",
+        "// (z[0] = s1, z[1] = s2)",
+        "",
+    ]
+
+    # Structure-of-arrays coefficient tables for SIMD processing across bands
+    lines.extend(_soa_declaration_lines(filters_order_2, 2))
+    lines.extend(_soa_declaration_lines(filters_order_4, 4))
+
+    lines += [
+        "void initializeCoefficients() {",
+        "    // Initialize all bands with their center frequencies",
+        "    for (int band = 0; band < NUM_BANDS; band++) {",
+        "        pFilterBank->bands[band].center_freq = center_frequencies[band];",
+        "    }",
+        "",
+    ]
+
+    # Order 2 coefficients
+    lines.append("    if (pFilterBank->filter_order == 2) {")
+    lines.extend(_band_initialization_lines(bands, filters_order_2))
+
+    # Order 4 coefficients
+    lines.append("    } else { // filter_order == 4")
+    lines.extend(_band_initialization_lines(bands, filters_order_4))
+
+    lines.append("    }")
+    lines.append("}")
+
     with open("data/cpp_coefficient_initialization.txt", "w") as f:
-        print("// C++ Coefficient Initialization for Third-Octave Filters", file=f)
-        print("void initializeCoefficients() {", file=f)
-        print("    // Initialize all bands with their center frequencies", file=f)
-        print("    for (int band = 0; band < NUM_BANDS; band++) {", file=f)
-        print("        pFilterBank->bands[band].center_freq = center_frequencies[band];", file=f)
-        print("    }", file=f)
-        print("", file=f)
-        
-        # Order 2 coefficients
-        print("    if (pFilterBank->filter_order == 2) {", file=f)
-        for band_idx, biquads in enumerate(filters_order_2):
-            if not biquads:
-                continue
-            center_freq = bands[band_idx][0]
-            print(f"        // Band {band_idx}: {center_freq} Hz", file=f)
-            print(f"        pFilterBank->bands[{band_idx}].num_sections = {len(biquads)};", file=f)
-            
-            for sec_idx, biquad in enumerate(biquads):
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].b[0] = {biquad['b'][0]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].b[1] = {biquad['b'][1]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].b[2] = {biquad['b'][2]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].a[0] = {biquad['a'][0]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].a[1] = {biquad['a'][1]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].a[2] = {biquad['a'][2]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].z[0] = 0.0;", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].z[1] = 0.0;", file=f)
-            print("", file=f)
-        
-        # Order 4 coefficients
-        print("    } else { // filter_order == 4", file=f)
-        for band_idx, biquads in enumerate(filters_order_4):
-            if not biquads:
-                continue
-            center_freq = bands[band_idx][0]
-            print(f"        // Band {band_idx}: {center_freq} Hz", file=f)
-            print(f"        pFilterBank->bands[{band_idx}].num_sections = {len(biquads)};", file=f)
-            
-            for sec_idx, biquad in enumerate(biquads):
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].b[0] = {biquad['b'][0]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].b[1] = {biquad['b'][1]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].b[2] = {biquad['b'][2]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].a[0] = {biquad['a'][0]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].a[1] = {biquad['a'][1]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].a[2] = {biquad['a'][2]:.12e};", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].z[0] = 0.0;", file=f)
-                print(f"        pFilterBank->bands[{band_idx}].sections[{sec_idx}].z[1] = 0.0;", file=f)
-            print("", file=f)
-        
-        print("    }", file=f)
-        print("}", file=f)
\ No newline at end of file
+        f.write("\n".join(lines) + "\n")
\ No newline at end of file
@@ -1,8 +1,20 @@
+from functools import lru_cache
+
 import numpy as np
 from scipy import signal
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+@lru_cache(maxsize=None)
 def design_cascaded_filters(low_freq, high_freq, order, fs):
-    """Design cascaded biquad filters for better numerical stability"""
+    """Design cascaded biquad filters for better numerical stability.
+
+    Results are cached and returned read-only; copy before modifying.
+    """
     # Normalized frequencies with safety bounds
     low = max(low_freq / (fs / 2), 1e-6)
     high = min(high_freq / (fs / 2), 0.99)
@@ -12,24 +24,30 @@ def design_cascaded_filters(low_freq, high_freq, order, fs):
     else:  # order == 4
         sos = signal.butter(4, [low, high], btype='bandpass', output='sos')
     
+    sos.flags.writeable = False
     return sos
 
+@njit(cache=True)
+def eval_biquad(coeffs, z_inv):
+    """Evaluate c0 + c1*z^-1 + c2*z^-2 with Horner's scheme.
+
+    coeffs has shape (..., 3), so a whole stack of sections can be evaluated
+    at once.
+    """
+    return (coeffs[..., 2] * z_inv + coeffs[..., 1]) * z_inv + coeffs[..., 0]
+
+@njit(cache=True)
 def normalize_sos_gain(sos, center_freq, fs):
-    """Normalize SOS filter to have unity gain at center frequency"""
+    """Normalize SOS filter to have unity gain at center frequency.
+
+    JIT-compiled with numba when it is installed.
+    """
     w = 2 * np.pi * center_freq / fs
     
-    # Calculate total gain through all sections
-    total_gain = 1.0
-    for section in sos:
-        b = section[0:3]
-        a = section[3:6]
-        
-        # Evaluate transfer function at center frequency
-        z = np.exp(1j * w)
-        H_num = b[0] + b[1] * z**(-1) + b[2] * z**(-2)
-        H_den = a[0] + a[1] * z**(-1) + a[2] * z**(-2)
-        H = H_num / H_den
-        total_gain *= abs(H)
+    # Calculate total gain through all sections at once
+    # (on the unit circle z**-1 == conj(z))
+    zc = np.exp(1j * w).conjugate()
+    total_gain = np.prod(np.abs(eval_biquad(sos[:, 0:3], zc) / eval_biquad(sos[:, 3:6], zc)))
     
     # Normalize first section's b coefficients
     if total_gain > 0:
@@ -37,18 +55,8 @@ def normalize_sos_gain(sos, center_freq, fs):
     
     return sos
 
-def sos_to_cascaded_biquads(sos):
-    """Convert SOS to format suitable for C++ implementation"""
-    biquads = []
-    for section in sos:
-        biquad = {
-            'b': section[0:3].copy(),  # b0, b1, b2
-            'a': section[3:6].copy()   # a0, a1, a2 (a0 should be 1.0)
-        }
-        # Ensure a0 = 1.0
-        if biquad['a'][0] != 1.0 and biquad['a'][0] != 0.0:
-            biquad['b'] /= biquad['a'][0]
-            biquad['a'] /= biquad['a'][0]
-        biquads.append(biquad)
-    
-    return biquads
\ No newline at end of file
+def design_band_filter(center_freq, low_freq, high_freq, order, fs):
+    """Design the gain-normalized cascaded biquads (an (N_sec, 6) SOS array) for a single band"""
+    # butter(..., output='sos') already returns every section with a0 = 1.0
+    sos = design_cascaded_filters(low_freq, high_freq, order, fs)
+    return normalize_sos_gain(sos.copy(), center_freq, fs)
\ No newline at end of file
@@ -1,8 +1,8 @@
+import numpy as np
+
 def compute_band_edges(center_freqs):
-    """Compute band edges for third-octave bands"""
-    bands = []
-    for f_c in center_freqs:
-        f_lower = f_c * (2 ** (-1/6))  # Lower bandedge
-        f_upper = f_c * (2 ** (1/6))   # Upper bandedge
-        bands.append((f_c, f_lower, f_upper))
-    return bands
\ No newline at end of file
+    """Compute band edges for third-octave bands as (center, lower, upper) rows"""
+    f_c = np.asarray(center_freqs, dtype=float)
+    f_lower = f_c * (2 ** (-1/6))  # Lower bandedge
+    f_upper = f_c * (2 ** (1/6))   # Upper bandedge
+    return np.stack([f_c, f_lower, f_upper], axis=1)
\ No newline at end of file
@@ -1,38 +1,61 @@
 import numpy as np
-from scipy import signal
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
-def plot_filter_responses(filters, bands, sr, title):
-    """Plot frequency responses of cascaded biquad filters for third-octave bands."""
+def plot_filter_responses(filters, bands, sr, title, ax=None):
+    """Plot frequency responses of cascaded biquad filters for third-octave bands.
+
+    Draws into ``ax`` when given (e.g. one axes of a shared figure), otherwise
+    into a new figure.
+    """
+    
+    if ax is None:
+        _, ax = plt.subplots(figsize=(12, 6))
     
-    plt.figure(figsize=(12, 6))
+    # Logspaced plotting grid and the Vandermonde rows [1, z^-1, z^-2] on it,
+    # shared by every band (shape (3, len(w)))
+    w = np.logspace(np.log10(15), np.log10(22000), 2048)
+    z_inv = np.exp(-1j * 2 * np.pi * w / sr)
+    V = np.vstack([np.ones_like(z_inv), z_inv, z_inv * z_inv])
     
-    for band_idx, biquads in enumerate(filters):
-        if not biquads:  # Skip if filter design failed
+    # All band curves go into one LineCollection (a single artist to draw);
+    # colors follow the default property cycle as separate lines would
+    colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    segments = []
+    segment_colors = []
+    legend_handles = []
+    
+    for band_idx, sos in enumerate(filters):
+        if sos is None:  # Skip if filter design failed
             continue
             
-        # Compute overall frequency response by cascading biquads
-        w = np.logspace(np.log10(15), np.log10(22000), 2048)
-        H_total = np.ones(len(w), dtype=complex)
+        # Compute overall magnitude response by cascading biquads; only the
+        # magnitude is plotted, so section responses are summed in dB
+        Hs = (sos[:, 0:3] @ V) / (sos[:, 3:6] @ V)
+        # 10*log10(|H|^2) avoids the hypot/sqrt inside np.abs on complex input
+        H_db = (10 * np.log10(Hs.real**2 + Hs.imag**2 + 1e-60)).sum(axis=0)
         
-        for biquad in biquads:
-            b, a = biquad['b'], biquad['a']
-            _, h = signal.freqz(b, a, worN=w, fs=sr)
-            H_total *= h
+        color = colors[len(segments) % len(colors)]
+        segments.append(np.column_stack([w, H_db]))
+        segment_colors.append(color)
         
-        # Plot with selective labeling
-        label = f"{bands[band_idx][0]:.1f} Hz" if band_idx % 4 == 0 else ""
-        plt.semilogx(w, 20 * np.log10(np.abs(H_total)), label=label)
+        # Selective labeling
+        if band_idx % 4 == 0:
+            legend_handles.append(Line2D([], [], color=color, label=f"{bands[band_idx][0]:.1f} Hz"))
+    
+    ax.add_collection(LineCollection(segments, colors=segment_colors))
+    ax.set_xscale('log')
     
-    plt.title(title)
-    plt.xlabel("Frequency (Hz)")
-    plt.ylabel("Magnitude (dB)")
-    plt.grid(True, which='both', ls='--', alpha=0.7)
-    plt.xticks([20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000],
-               [r'$20$', r'$50$', r'$100$', r'$200$', r'$500$', r'$1k$', r'$2k$', r'$5k$', r'$10k$', r'$20k$'],
-               rotation=45) 
-    plt.xlim(15, 22000)
-    plt.ylim(-60, 5)
-    if any(band_idx % 4 == 0 for band_idx in range(len(filters))):
-        plt.legend(loc='lower left', fontsize='small', ncol=2)
-    plt.tight_layout()
\ No newline at end of file
+    ax.set_title(title)
+    ax.set_xlabel("Frequency (Hz)")
+    ax.set_ylabel("Magnitude (dB)")
+    ax.grid(True, which='both', ls='--', alpha=0.7)
+    ax.set_xticks([20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000])
+    ax.set_xticklabels([r'$20$', r'$50$', r'$100$', r'$200$', r'$500$', r'$1k$', r'$2k$', r'$5k$', r'$10k$', r'$20k$'],
+                       rotation=45)
+    ax.set_xlim(15, 22000)
+    ax.set_ylim(-60, 5)
+    if legend_handles:
+        ax.legend(handles=legend_handles, loc='lower left', fontsize='small', ncol=2)
+    ax.figure.tight_layout()
\ No newline at end of file
@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import matplotlib.pyplot as plt
 from code.frequency_cut import compute_band_edges
-from code.filter_design import design_cascaded_filters, normalize_sos_gain, sos_to_cascaded_biquads
+from code.filter_design import design_band_filter
 from code.plot_filter import plot_filter_responses
 from code.export_to_cpp import generate_cpp_initialization
 
@@ -20,39 +22,35 @@ if __name__ == "__main__":
     bands = compute_band_edges(NOMINAL_CENTER_FREQS)
     NUM_BANDS = len(bands)
 
-    # Calculate coefficients
-    filters_order_2 = []
-    filters_order_4 = []
-
+    # Calculate coefficients (bands are independent, so design them concurrently)
     print(f"Designing {NUM_BANDS} third-octave filters...")
     for band_idx, (center_freq, low_freq, high_freq) in enumerate(bands):
         print(f"Band {band_idx}: {center_freq} Hz ({low_freq:.1f} - {high_freq:.1f} Hz)")
-        
-        # Order 2
-        try:
-            sos_2 = design_cascaded_filters(low_freq, high_freq, 2, SAMPLE_RATE)
-            sos_2_norm = normalize_sos_gain(sos_2.copy(), center_freq, SAMPLE_RATE)
-            biquads_2 = sos_to_cascaded_biquads(sos_2_norm)
-            filters_order_2.append(biquads_2)
-        except Exception as e:
-            print(f"Error designing order 2 filter for {center_freq} Hz: {e}")
-            filters_order_2.append([])
-        
-        # Order 4
-        try:
-            sos_4 = design_cascaded_filters(low_freq, high_freq, 4, SAMPLE_RATE)
-            sos_4_norm = normalize_sos_gain(sos_4.copy(), center_freq, SAMPLE_RATE)
-            biquads_4 = sos_to_cascaded_biquads(sos_4_norm)
-            filters_order_4.append(biquads_4)
-        except Exception as e:
-            print(f"Error designing order 4 filter for {center_freq} Hz: {e}")
-            filters_order_4.append([])
 
-    # Plot responses
-    plot_filter_responses(filters_order_2, bands, SAMPLE_RATE, "Order 2 Third-Octave Filters (Cascaded Biquads)")
-    plt.show()
+    with ThreadPoolExecutor() as executor:
+        futures = {
+            order: [executor.submit(design_band_filter, center_freq, low_freq, high_freq, order, SAMPLE_RATE)
+                    for (center_freq, low_freq, high_freq) in bands]
+            for order in (2, 4)
+        }
+
+        designed = {}
+        for order, band_futures in futures.items():
+            designed[order] = []
+            for (center_freq, _, _), future in zip(bands, band_futures):
+                try:
+                    designed[order].append(future.result())
+                except Exception as e:
+                    print(f"Error designing order {order} filter for {center_freq} Hz: {e}")
+                    designed[order].append(None)
+
+    filters_order_2 = designed[2]
+    filters_order_4 = designed[4]
 
-    plot_filter_responses(filters_order_4, bands, SAMPLE_RATE, "Order 4 Third-Octave Filters (Cascaded Biquads)")
+    # Plot responses (both orders in one figure)
+    fig, (ax_order_2, ax_order_4) = plt.subplots(2, 1, sharex=True, figsize=(12, 10))
+    plot_filter_responses(filters_order_2, bands, SAMPLE_RATE, "Order 2 Third-Octave Filters (Cascaded Biquads)", ax=ax_order_2)
+    plot_filter_responses(filters_order_4, bands, SAMPLE_RATE, "Order 4 Third-Octave Filters (Cascaded Biquads)", ax=ax_order_4)
     plt.show()
 
     generate_cpp_initialization(bands, filters_order_2, filters_order_4)
@@ -62,14 +60,14 @@ if __name__ == "__main__":
     # Verification: Print some sample coefficients
     print("\nSample coefficients for verification:")
     print("Order 2, Band 0 (20 Hz):")
-    if filters_order_2[0]:
-        biquad = filters_order_2[0][0]
-        print(f"  b: [{biquad['b'][0]:.6e}, {biquad['b'][1]:.6e}, {biquad['b'][2]:.6e}]")
-        print(f"  a: [{biquad['a'][0]:.6e}, {biquad['a'][1]:.6e}, {biquad['a'][2]:.6e}]")
+    if filters_order_2[0] is not None:
+        section = filters_order_2[0][0]
+        print(f"  b: [{section[0]:.6e}, {section[1]:.6e}, {section[2]:.6e}]")
+        print(f"  a: [{section[3]:.6e}, {section[4]:.6e}, {section[5]:.6e}]")
 
     print("Order 4, Band 15 (1000 Hz):")
-    if filters_order_4[15]:
-        for i, biquad in enumerate(filters_order_4[15]):
+    if filters_order_4[15] is not None:
+        for i, section in enumerate(filters_order_4[15]):
             print(f"  Section {i+1}:")
-            print(f"    b: [{biquad['b'][0]:.6e}, {biquad['b'][1]:.6e}, {biquad['b'][2]:.6e}]")
-            print(f"    a: [{biquad['a'][0]:.6e}, {biquad['a'][1]:.6e}, {biquad['a'][2]:.6e}]")
\ No newline at end of file
+            print(f"    b: [{section[0]:.6e}, {section[1]:.6e}, {section[2]:.6e}]")
+            print(f"    a: [{section[3]:.6e}, {section[4]:.6e}, {section[5]:.6e}]")
\ No newline at end of file
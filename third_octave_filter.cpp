@@ -56,9 +56,10 @@ static const double center_frequencies[NUM_BANDS] = {
 
 static struct third_octave_filter *pFilterBank;
 
-// Process a single sample through one biquad section (Direct Form I)
+// Process a single sample through one biquad section (Transposed Direct Form II)
 double processBiquad(struct BiquadSection* section, double input) {
-    // Direct Form I: y[n] = b0*x[n] + b1*x[n-1] + b2*x[n-2] - a1*y[n-1] - a2*y[n-2]
+    // Transposed Direct Form II: y[n] = b0*x[n] + s1; s1 = b1*x[n] - a1*y[n] + s2; s2 = b2*x[n] - a2*y[n]
+    // Equivalent to y[n] = b0*x[n] + b1*x[n-1] + b2*x[n-2] - a1*y[n-1] - a2*y[n-2]
     double output = section->b[0] * input + section->z[0];
     section->z[0] = section->b[1] * input - section->a[1] * output + section->z[1];
     section->z[1] = section->b[2] * input - section->a[2] * output;